@@ -7,10 +7,13 @@ from .analyzer import CodeAnalyzer
 from .vulnerability_detector import VulnerabilityDetector
 from .bug_pattern_detector import BugPatternDetector
 from .ml_model import MLCodeReviewer
+from .pipeline import Pipeline, ParsedFile
 
 __all__ = [
     "CodeAnalyzer",
     "VulnerabilityDetector",
     "BugPatternDetector",
     "MLCodeReviewer",
+    "Pipeline",
+    "ParsedFile",
 ]
@@ -1,14 +1,158 @@
 """Main code analyzer module for AI Code Guardian."""
 
 import ast
-import re
-from typing import Dict, List, Any, Optional
+import copy
+import hashlib
+import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import chain, islice
+from typing import Dict, List, Any, Callable, Iterable, Iterator, Optional, Set, Tuple
 from pathlib import Path
 import logging
 
+from .ast_utils import TableVisitor
+
+try:
+    import re2 as _re
+except ImportError:
+    import re as _re
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Character classes are spelled out in ASCII because RE2's \s and \w are
+# ASCII-only while the stdlib's are Unicode; this keeps both engines in step
+_JS_FUNCTION_RE = _re.compile(r'function[ \t\n\r\f\v]+[A-Za-z0-9_]+')
+_JS_ARROW_RE = _re.compile(r'=>')
+_JS_CLASS_RE = _re.compile(r'class[ \t\n\r\f\v]+[A-Za-z0-9_]+')
+
+_COMPLEXITY_TYPES = frozenset({ast.If, ast.While, ast.For, ast.ExceptHandler})
+
+# LRU of Python analysis results keyed by source digest rather than source
+# text, so cached entries do not keep whole files alive
+_PYTHON_CACHE_SIZE = 512
+_python_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_python_cache_lock = threading.Lock()
+
+
+def _source_key(code: str) -> bytes:
+    """Return a compact digest identifying ``code``."""
+    return hashlib.blake2b(code.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+# Below this many files, process start-up costs more than parallel parsing saves
+_MIN_FILES_FOR_POOL = 16
+
+
+def _submit_inline(fn: Callable[..., Any], *args: Any) -> Future:
+    """Run ``fn`` in-process and wrap its result like ``Executor.submit`` would."""
+    future = Future()
+    future.set_result(fn(*args))
+    return future
+
+
+def _walk_files(root: str, ext_set: Set[str]) -> Iterator[os.DirEntry]:
+    """Yield entries for files under ``root`` whose extension is in ``ext_set``.
+    
+    Walks with ``os.scandir`` so each entry's type comes from the directory
+    listing, without a ``Path`` object or ``stat`` call per entry (only
+    ``DirEntry.stat()`` does one on POSIX). Entries are yielded as they are
+    found. Symlinked directories are not followed.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file() and os.path.splitext(entry.name)[1] in ext_set:
+                    yield entry
+
+
+def _size_key(entry: os.DirEntry) -> Optional[Tuple[str, int]]:
+    """Return a file's extension and size, or None if it cannot be stat'ed.
+    
+    Only files sharing this key can be byte-identical duplicates. The
+    extension is part of it because it selects the analysis applied.
+    """
+    try:
+        size = entry.stat().st_size
+    except OSError:
+        return None
+    return os.path.splitext(entry.name)[1], size
+
+
+def _file_digest(file_path: str) -> Optional[bytes]:
+    """Return a digest of a file's contents, or None if it is unreadable."""
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class _MetricsVisitor(TableVisitor):
+    """Collects complexity, function, class and import metrics in one pass.
+    
+    Nodes are visited depth-first, so ``imports`` lists imports in source
+    order, including those nested in functions and classes.
+    """
+    
+    def __init__(self):
+        self.complexity = 1
+        self.functions = 0
+        self.classes = 0
+        self.imports = []
+        
+    def results(self) -> Dict[str, Any]:
+        """Return the collected metrics as analysis results."""
+        return {
+            "complexity": self.complexity,
+            "functions": self.functions,
+            "classes": self.classes,
+            "imports": self.imports,
+        }
+        
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self.functions += 1
+        
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self.classes += 1
+        
+    def visit_Import(self, node: ast.Import):
+        for name in node.names:
+            self.imports.append(name.name)
+            
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        module = node.module or ''
+        for name in node.names:
+            self.imports.append(f"{module}.{name.name}")
+            
+    def visit_branch(self, node: ast.AST):
+        self.complexity += 1
+        
+    def visit_BoolOp(self, node: ast.BoolOp):
+        self.complexity += len(node.values) - 1
+
+
+_MetricsVisitor._handlers = {
+    ast.FunctionDef: _MetricsVisitor.visit_FunctionDef,
+    ast.ClassDef: _MetricsVisitor.visit_ClassDef,
+    ast.Import: _MetricsVisitor.visit_Import,
+    ast.ImportFrom: _MetricsVisitor.visit_ImportFrom,
+    ast.BoolOp: _MetricsVisitor.visit_BoolOp,
+    **dict.fromkeys(_COMPLEXITY_TYPES, _MetricsVisitor.visit_branch),
+}
+
 
 class CodeAnalyzer:
     """Main analyzer class for code review and analysis."""
@@ -40,122 +184,196 @@ class CodeAnalyzer:
             logger.error(f"Error analyzing file {file_path}: {e}")
             return {"error": str(e)}
     
-    def _analyze_code(self, code: str, file_extension: str) -> Dict[str, Any]:
-        """Perform detailed code analysis."""
+    def _analyze_code(self, code: str, file_extension: str,
+                      metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Perform detailed code analysis.
+        
+        Precomputed Python ``metrics`` may be passed to skip parsing ``code``.
+        """
         results = {
-            "lines_of_code": len(code.split('\n')),
+            "lines_of_code": code.count('\n') + (0 if code.endswith('\n') else 1),
             "file_type": file_extension,
             "issues": [],
             "metrics": {}
         }
         
         if file_extension == '.py':
-            results.update(self._analyze_python(code))
+            results.update(metrics if metrics is not None else self._analyze_python(code))
         elif file_extension in ['.js', '.ts']:
             results.update(self._analyze_javascript(code))
             
         return results
     
     def _analyze_python(self, code: str) -> Dict[str, Any]:
-        """Analyze Python code using AST."""
-        try:
-            tree = ast.parse(code)
-            
-            analysis = {
-                "complexity": self._calculate_complexity(tree),
-                "functions": self._count_functions(tree),
-                "classes": self._count_classes(tree),
-                "imports": self._extract_imports(tree),
-            }
-            
-            return analysis
-            
-        except SyntaxError as e:
-            return {"syntax_error": str(e)}
+        """Analyze Python code using AST.
+        
+        Results are memoized by a hash of ``code``, so re-analyzing unchanged
+        source skips parsing and walking entirely.
+        """
+        key = _source_key(code)
+        with _python_cache_lock:
+            analysis = _python_cache.get(key)
+            if analysis is not None:
+                _python_cache.move_to_end(key)
+                
+        if analysis is None:
+            try:
+                tree = ast.parse(code)
+                analysis = self._collect_metrics(tree)
+            except SyntaxError as e:
+                analysis = {"syntax_error": str(e)}
+            with _python_cache_lock:
+                _python_cache[key] = analysis
+                if len(_python_cache) > _PYTHON_CACHE_SIZE:
+                    _python_cache.popitem(last=False)
+                    
+        return copy.deepcopy(analysis)
+    
+    def _collect_metrics(self, tree: ast.AST) -> Dict[str, Any]:
+        """Collect complexity, function, class and import metrics in one traversal."""
+        visitor = _MetricsVisitor()
+        visitor.visit(tree)
+        return visitor.results()
     
     def _calculate_complexity(self, tree: ast.AST) -> int:
         """Calculate cyclomatic complexity."""
-        complexity = 1
-        
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
-                complexity += 1
-            elif isinstance(node, ast.BoolOp):
-                complexity += len(node.values) - 1
-                
-        return complexity
+        return self._collect_metrics(tree)["complexity"]
     
     def _count_functions(self, tree: ast.AST) -> int:
         """Count number of functions in the code."""
-        return sum(1 for node in ast.walk(tree) if isinstance(node, ast.FunctionDef))
+        return self._collect_metrics(tree)["functions"]
     
     def _count_classes(self, tree: ast.AST) -> int:
         """Count number of classes in the code."""
-        return sum(1 for node in ast.walk(tree) if isinstance(node, ast.ClassDef))
+        return self._collect_metrics(tree)["classes"]
     
     def _extract_imports(self, tree: ast.AST) -> List[str]:
-        """Extract all import statements."""
-        imports = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for name in node.names:
-                    imports.append(name.name)
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ''
-                for name in node.names:
-                    imports.append(f"{module}.{name.name}")
-        return imports
+        """Extract all import statements, in source order."""
+        return self._collect_metrics(tree)["imports"]
     
     def _analyze_javascript(self, code: str) -> Dict[str, Any]:
         """Basic JavaScript code analysis."""
         analysis = {
-            "functions": len(re.findall(r'function\s+\w+', code)),
-            "arrow_functions": len(re.findall(r'=>', code)),
-            "classes": len(re.findall(r'class\s+\w+', code)),
+            "functions": sum(1 for _ in _JS_FUNCTION_RE.finditer(code)),
+            "arrow_functions": sum(1 for _ in _JS_ARROW_RE.finditer(code)),
+            "classes": sum(1 for _ in _JS_CLASS_RE.finditer(code)),
         }
         return analysis
     
-    def analyze_directory(self, dir_path: str, extensions: List[str] = None) -> List[Dict[str, Any]]:
+    def analyze_directory(self, dir_path: str, extensions: List[str] = None,
+                          max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
         """Analyze all code files in a directory.
         
+        Files are parsed in parallel across worker processes while the
+        directory is still being walked. Results are yielded in discovery
+        order, each as soon as it and every earlier file are done; wrap the
+        call in ``list()`` to keep them all. Byte-identical files are analyzed
+        once, so the analysis of the first file of each extension and size is
+        kept for the rest of the scan.
+        
+        Small directories, and ``max_workers=1``, are analyzed in-process. On
+        platforms that spawn workers (macOS, Windows) the calling script must
+        guard its entry point with ``if __name__ == "__main__":``.
+        
         Args:
             dir_path: Path to directory
             extensions: List of file extensions to analyze (e.g., ['.py', '.js'])
+            max_workers: Number of worker processes (defaults to the CPU count)
             
-        Returns:
-            List of analysis results for each file
+        Yields:
+            Analysis results for each file
         """
         if extensions is None:
             extensions = ['.py', '.js', '.ts', '.java', '.cpp']
             
-        results = []
-        path = Path(dir_path)
-        
-        for ext in extensions:
-            for file_path in path.rglob(f'*{ext}'):
-                logger.info(f"Analyzing: {file_path}")
-                result = self.analyze_file(str(file_path))
-                result['file_path'] = str(file_path)
-                results.append(result)
-                
-        return results
+        # Byte-identical files (vendored copies, generated code) are analyzed
+        # once. Files are grouped by extension and size, and a file is only
+        # hashed once a second file of the same group turns up; until then it
+        # is held under ``None``. Each group maps digests to the path and
+        # future of the first file with that content.
+        groups: Dict[Tuple[str, int], Dict[Optional[bytes], Tuple[str, Future]]] = {}
+        window = 4 * (max_workers or os.cpu_count() or 1)
+        
+        files = _walk_files(dir_path, set(extensions))
+        head = list(islice(files, _MIN_FILES_FOR_POOL))
+        use_pool = max_workers != 1 and len(head) >= _MIN_FILES_FOR_POOL
+        with ProcessPoolExecutor(max_workers=max_workers) if use_pool else nullcontext() as pool:
+            submit = pool.submit if use_pool else _submit_inline
+            pending = deque()
+            for entry in chain(head, files):
+                file_path = entry.path
+                group = _size_key(entry)
+                members = None if group is None else groups.setdefault(group, {})
+                digest = None
+                original = None
+                if members:
+                    first = members.pop(None, None)
+                    if first is not None:
+                        first_digest = _file_digest(first[0])
+                        if first_digest is not None:
+                            members[first_digest] = first
+                    digest = _file_digest(file_path)
+                    if digest is not None:
+                        original = members.get(digest)
+                        
+                if original is not None:
+                    pending.append((file_path, original[1], True))
+                else:
+                    future = submit(self._analyze_path, file_path)
+                    if members is not None and (digest is not None or not members):
+                        members[digest] = (file_path, future)
+                    pending.append((file_path, future, False))
+                    
+                if len(pending) >= window:
+                    yield self._resolve_result(*pending.popleft())
+                    
+            while pending:
+                yield self._resolve_result(*pending.popleft())
     
-    def generate_report(self, results: List[Dict[str, Any]]) -> str:
-        """Generate a comprehensive analysis report."""
-        report = "# Code Analysis Report\n\n"
-        report += f"Total files analyzed: {len(results)}\n\n"
+    def _resolve_result(self, file_path: str, future: Future, duplicate: bool) -> Dict[str, Any]:
+        """Wait for a file's analysis, or copy it from an identical earlier file.
         
-        total_loc = sum(r.get('lines_of_code', 0) for r in results)
-        report += f"Total lines of code: {total_loc}\n\n"
+        The future's own result is kept for later duplicates, so a copy is
+        returned either way and callers may modify it freely.
+        """
+        result = copy.deepcopy(future.result())
+        if duplicate:
+            logger.info(f"Reusing analysis for duplicate file: {file_path}")
+            result['file_path'] = file_path
+        return result
+    
+    def _analyze_path(self, file_path: str) -> Dict[str, Any]:
+        """Analyze a file and tag the result with its path."""
+        logger.info(f"Analyzing: {file_path}")
+        result = self.analyze_file(file_path)
+        result['file_path'] = file_path
+        return result
+    
+    def generate_report(self, results: Iterable[Dict[str, Any]]) -> str:
+        """Generate a comprehensive analysis report.
+        
+        ``results`` is consumed in a single pass, so the iterator returned by
+        ``analyze_directory`` can be passed in directly.
+        """
+        total_files = 0
+        total_loc = 0
+        parts = []
         
         for result in results:
-            report += f"## {result.get('file_path', 'Unknown')}\n"
-            report += f"- Lines: {result.get('lines_of_code', 0)}\n"
-            report += f"- Complexity: {result.get('complexity', 'N/A')}\n"
+            total_files += 1
+            total_loc += result.get('lines_of_code', 0)
+            parts.append(f"## {result.get('file_path', 'Unknown')}\n")
+            parts.append(f"- Lines: {result.get('lines_of_code', 0)}\n")
+            parts.append(f"- Complexity: {result.get('complexity', 'N/A')}\n")
             if 'issues' in result and result['issues']:
-                report += "- Issues found:\n"
+                parts.append("- Issues found:\n")
                 for issue in result['issues']:
-                    report += f"  - {issue}\n"
-            report += "\n"
+                    parts.append(f"  - {issue}\n")
+            parts.append("\n")
             
-        return report
+        header = [
+            "# Code Analysis Report\n\n",
+            f"Total files analyzed: {total_files}\n\n",
+            f"Total lines of code: {total_loc}\n\n",
+        ]
+        return "".join(header + parts)
@@ -0,0 +1,111 @@
+"""Shared AST traversal helpers."""
+
+import ast
+from typing import Any, Callable, Dict, Iterator, Tuple
+
+
+# Per node type, the fields to descend into, reversed for stack order
+_CHILD_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _child_fields(node_type: type) -> Tuple[str, ...]:
+    """Compute and cache the traversal fields for ``node_type``."""
+    fields = tuple(field for field in reversed(node_type._fields) if field != 'ctx')
+    _CHILD_FIELDS[node_type] = fields
+    return fields
+
+
+def iter_nodes(tree: ast.AST) -> Iterator[ast.AST]:
+    """Yield every node of ``tree`` in source-order preorder.
+    
+    Uses an explicit stack over each node's ``_fields`` instead of recursion
+    or ``ast.iter_child_nodes``, so deep trees cannot hit the recursion limit.
+    Expression-context markers (``Load``/``Store``/``Del``), which carry no
+    information and make up about a third of all nodes, are not yielded.
+    """
+    stack = [tree]
+    pop = stack.pop
+    push = stack.append
+    get_fields = _CHILD_FIELDS.get
+    while stack:
+        node = pop()
+        yield node
+        fields = get_fields(type(node))
+        if fields is None:
+            fields = _child_fields(type(node))
+        for field in fields:
+            value = getattr(node, field, None)
+            if type(value) is list:
+                for item in reversed(value):
+                    if isinstance(item, ast.AST):
+                        push(item)
+            elif isinstance(value, ast.AST):
+                push(value)
+
+
+_BLOCK_FIELDS = ('body', 'handlers', 'orelse', 'finalbody', 'cases')
+
+
+def iter_statements(tree: ast.AST) -> Iterator[ast.AST]:
+    """Yield ``tree`` and its nested statements in source-order preorder.
+    
+    Only statement blocks are followed (including except handlers and match
+    cases); expression subtrees are never entered, which skips most nodes.
+    """
+    stack = [tree]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        node = pop()
+        yield node
+        for field in reversed(_BLOCK_FIELDS):
+            value = getattr(node, field, None)
+            if type(value) is list:
+                for item in reversed(value):
+                    push(item)
+
+
+class TableVisitor(ast.NodeVisitor):
+    """NodeVisitor that dispatches on ``type(node)`` through a handler table.
+    
+    Subclasses set ``_handlers`` to a ``{node type: unbound method}`` mapping,
+    built once at import instead of NodeVisitor's per-node
+    ``'visit_' + class name`` lookup. Handlers only inspect their own node;
+    ``visit`` walks the whole tree iteratively and then calls ``finish``.
+    """
+    
+    _handlers: Dict[type, Callable[[Any, ast.AST], None]] = {}
+    
+    def visit(self, node: ast.AST):
+        handlers = self._handlers
+        for child in iter_nodes(node):
+            handler = handlers.get(type(child))
+            if handler is not None:
+                handler(self, child)
+        self.finish()
+        
+    def finish(self):
+        """Hook run once after the whole tree has been visited."""
+
+
+class CompositeVisitor(ast.NodeVisitor):
+    """Runs several TableVisitors over a single shared traversal.
+    
+    Each node is dispatched once and fed to every sub-visitor registered for
+    its type, so N rule sets cost one walk instead of N.
+    """
+    
+    def __init__(self, *visitors: TableVisitor):
+        self._visitors = visitors
+        self._handlers: Dict[type, list] = {}
+        for visitor in visitors:
+            for node_type, handler in visitor._handlers.items():
+                self._handlers.setdefault(node_type, []).append(handler.__get__(visitor))
+                
+    def visit(self, node: ast.AST):
+        handlers = self._handlers
+        for child in iter_nodes(node):
+            for handler in handlers.get(type(child), ()):
+                handler(child)
+        for visitor in self._visitors:
+            visitor.finish()
@@ -2,8 +2,305 @@
 
 import ast
 import re
+import warnings
 from typing import List, Dict, Any
 
+from .ast_utils import TableVisitor, iter_nodes, iter_statements
+
+try:
+    from re import _parser as _sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse
+
+_REGEX_MODULES = frozenset({'re', 'regex'})
+# Regex functions taking a pattern, mapped to the position of their flags argument
+_REGEX_FUNCTIONS = {
+    'compile': 1, 'search': 2, 'match': 2, 'fullmatch': 2, 'findall': 2, 'finditer': 2,
+    'split': 3, 'sub': 4, 'subn': 4,
+}
+_MUTABLE_TYPES = frozenset({ast.List, ast.Dict, ast.Set})
+_REPEAT_OPS = (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT)
+_LOOKAROUND_OPS = (_sre_parse.ASSERT, _sre_parse.ASSERT_NOT)
+
+# Character sets are approximated as (ASCII code points, may match non-ASCII)
+_ASCII = frozenset(range(128))
+_ANY_CHAR = (_ASCII, True)
+_DIGITS = frozenset(b'0123456789')
+_SPACES = frozenset(b' \t\n\r\f\v\x1c\x1d\x1e\x1f')
+_WORD = frozenset(b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
+_CATEGORY_CHARS = {
+    _sre_parse.CATEGORY_DIGIT: (_DIGITS, True),
+    _sre_parse.CATEGORY_NOT_DIGIT: (_ASCII - _DIGITS, True),
+    _sre_parse.CATEGORY_SPACE: (_SPACES, True),
+    _sre_parse.CATEGORY_NOT_SPACE: (_ASCII - _SPACES, True),
+    _sre_parse.CATEGORY_WORD: (_WORD, True),
+    _sre_parse.CATEGORY_NOT_WORD: (_ASCII - _WORD, True),
+}
+
+
+def _single_chars(op, av, flags: int):
+    """Return the character set of a one-character regex item, or None."""
+    if op == _sre_parse.LITERAL:
+        return (frozenset({av}), False) if av < 128 else (frozenset(), True)
+    if op == _sre_parse.NOT_LITERAL:
+        return _ASCII - {av}, True
+    if op == _sre_parse.ANY:
+        return _ANY_CHAR if flags & _sre_parse.SRE_FLAG_DOTALL else (_ASCII - {10}, True)
+    if op != _sre_parse.IN:
+        return None
+        
+    chars = set()
+    non_ascii = negate = False
+    for item_op, item_av in av:
+        if item_op == _sre_parse.NEGATE:
+            negate = True
+        elif item_op == _sre_parse.LITERAL:
+            if item_av < 128:
+                chars.add(item_av)
+            else:
+                non_ascii = True
+        elif item_op == _sre_parse.RANGE:
+            low, high = item_av
+            chars.update(range(low, min(high, 127) + 1))
+            non_ascii = non_ascii or high >= 128
+        else:
+            category_chars, category_non_ascii = _CATEGORY_CHARS.get(item_av, _ANY_CHAR)
+            chars |= category_chars
+            non_ascii = non_ascii or category_non_ascii
+    if negate:
+        return _ASCII - chars, True
+    return frozenset(chars), non_ascii
+
+
+def _consumed_chars(items, flags: int):
+    """Return the set of characters a parsed regex sequence can consume."""
+    chars = set()
+    non_ascii = False
+    for op, av in items:
+        part = _single_chars(op, av, flags)
+        if part is None:
+            if op in _REPEAT_OPS:
+                part = _consumed_chars(av[2], flags)
+            elif op == _sre_parse.SUBPATTERN:
+                part = _consumed_chars(av[-1], flags)
+            elif op == _sre_parse.BRANCH:
+                part = _consumed_chars([item for branch in av[1] for item in branch], flags)
+            elif op == _sre_parse.AT or op in _LOOKAROUND_OPS:
+                continue  # zero-width
+            else:
+                return _ANY_CHAR
+        chars |= part[0]
+        non_ascii = non_ascii or part[1]
+    return frozenset(chars), non_ascii
+
+
+def _edge_chars(items, index: int, flags: int):
+    """Return the character set of the first (0) or last (-1) item of a sequence.
+    
+    Groups are looked through; anything other than a single required
+    character gives None.
+    """
+    while items:
+        op, av = items[index]
+        if op != _sre_parse.SUBPATTERN:
+            return _single_chars(op, av, flags)
+        items = av[-1]
+    return None
+
+
+def _disjoint(first, second, flags: int) -> bool:
+    """Return True if two character sets cannot match the same character."""
+    if first[1] and second[1]:
+        return False
+    first_chars, second_chars = first[0], second[0]
+    if flags & _sre_parse.SRE_FLAG_IGNORECASE:
+        first_chars = {ord(chr(c).lower()) for c in first_chars}
+        second_chars = {ord(chr(c).lower()) for c in second_chars}
+    return first_chars.isdisjoint(second_chars)
+
+
+def _unbounded_repeats(items):
+    """Yield the body of every unbounded repeat within a parsed regex sequence."""
+    for op, av in items:
+        if op in _REPEAT_OPS:
+            if av[1] == _sre_parse.MAXREPEAT:
+                yield av[2]
+            yield from _unbounded_repeats(av[2])
+        elif op == _sre_parse.SUBPATTERN:
+            yield from _unbounded_repeats(av[-1])
+        elif op == _sre_parse.BRANCH:
+            for branch in av[1]:
+                yield from _unbounded_repeats(branch)
+        elif op in _LOOKAROUND_OPS:
+            yield from _unbounded_repeats(av[1])
+
+
+def _can_overlap(body, inner, flags: int) -> bool:
+    """Check whether an inner repeat can run into the next iteration of ``body``.
+    
+    If ``body`` starts or ends with a character the inner repeat cannot
+    match, as the ``.`` in ``\\d+(\\.\\d+)*``, that separator fixes where each
+    outer iteration begins and the input can only be split one way.
+    """
+    inner_chars = _consumed_chars(inner, flags)
+    for index in (0, -1):
+        edge = _edge_chars(body, index, flags)
+        if edge is not None and _disjoint(edge, inner_chars, flags):
+            return False
+    return True
+
+
+def _has_nested_quantifier(items, flags: int = 0) -> bool:
+    """Check a parsed regex for overlapping nested unbounded quantifiers, as in ``(a+)+``."""
+    for op, av in items:
+        if op in _REPEAT_OPS:
+            body = av[2]
+            if av[1] == _sre_parse.MAXREPEAT and any(
+                    _can_overlap(body, inner, flags) for inner in _unbounded_repeats(body)):
+                return True
+            if _has_nested_quantifier(body, flags):
+                return True
+        elif op == _sre_parse.SUBPATTERN:
+            if _has_nested_quantifier(av[-1], flags):
+                return True
+        elif op == _sre_parse.BRANCH:
+            if any(_has_nested_quantifier(branch, flags) for branch in av[1]):
+                return True
+        elif op in _LOOKAROUND_OPS:
+            if _has_nested_quantifier(av[1], flags):
+                return True
+    return False
+
+
+def _constant_flags(node: ast.AST):
+    """Evaluate a flags argument built from integers and ``re.X``-style names.
+    
+    Returns None if the value is not known without running the code.
+    """
+    if isinstance(node, ast.Constant) and type(node.value) is int:
+        return node.value
+    if (isinstance(node, ast.Attribute)
+            and isinstance(node.value, ast.Name)
+            and node.value.id in _REGEX_MODULES):
+        flag = re.RegexFlag.__members__.get(node.attr)
+        return None if flag is None else int(flag)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        left = _constant_flags(node.left)
+        right = _constant_flags(node.right)
+        if left is not None and right is not None:
+            return left | right
+    return None
+
+
+def _call_flags(node: ast.Call, position: int) -> int:
+    """Return the regex flags passed to a call, or 0 if they are not constant."""
+    if len(node.args) > position:
+        flags = node.args[position]
+    else:
+        flags = next((kw.value for kw in node.keywords if kw.arg == 'flags'), None)
+    if flags is None:
+        return 0
+    return _constant_flags(flags) or 0
+
+
+def _is_redos_prone(pattern: str, flags: int = 0) -> bool:
+    """Return True if a regex literal can backtrack catastrophically."""
+    try:
+        # The parser warns about the analyzed code (e.g. possible nested sets)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            parsed = _sre_parse.parse(pattern, flags)
+        return _has_nested_quantifier(parsed, parsed.state.flags)
+    except Exception:
+        # Invalid or oversized patterns (e.g. huge repeat counts) are not ReDoS findings
+        return False
+
+
+class _BugVisitor(TableVisitor):
+    """Runs every AST-based bug rule over a parsed module."""
+    
+    def __init__(self, patterns: List[Dict[str, Any]]):
+        self.patterns = patterns
+        self.regex_patterns = []
+        self.imports_regex = False
+        
+    def visit(self, node: ast.AST):
+        """Run the rules, entering expressions only when a rule can match there.
+        
+        Bare excepts and mutable defaults live on statements, so they only need
+        the statement skeleton. Regex literals are checked in a second, full
+        walk that runs only if the module imports a regex module.
+        """
+        handlers = self._handlers
+        for child in iter_statements(node):
+            handler = handlers.get(type(child))
+            if handler is not None:
+                handler(self, child)
+                
+        if self.imports_regex:
+            for child in iter_nodes(node):
+                if type(child) is ast.Call:
+                    self.visit_Call(child)
+        self.finish()
+        
+    def finish(self):
+        """Report regex findings, after the statement-level ones, if a regex module is imported."""
+        if self.imports_regex:
+            self.patterns.extend(self.regex_patterns)
+        
+    def visit_Import(self, node: ast.AST):
+        """Note whether a regex module name is bound."""
+        for alias in node.names:
+            if (alias.asname or alias.name.partition('.')[0]) in _REGEX_MODULES:
+                self.imports_regex = True
+                
+    def visit_ExceptHandler(self, node: ast.ExceptHandler):
+        """Detect bare except clauses."""
+        if node.type is None:
+            self.patterns.append({
+                "type": "Bare Except Clause",
+                "severity": "MEDIUM",
+                "description": "Bare except catches all exceptions, including system exits"
+            })
+        
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        """Detect mutable default arguments."""
+        for arg in node.args.defaults:
+            if type(arg) in _MUTABLE_TYPES:
+                self.patterns.append({
+                    "type": "Mutable Default Argument",
+                    "severity": "HIGH",
+                    "description": "Mutable default arguments can cause unexpected behavior",
+                    "function": node.name
+                })
+        
+    def visit_Call(self, node: ast.Call):
+        """Detect regex literals with nested quantifiers (ReDoS)."""
+        func = node.func
+        if (isinstance(func, ast.Attribute)
+                and isinstance(func.value, ast.Name)
+                and func.value.id in _REGEX_MODULES
+                and func.attr in _REGEX_FUNCTIONS
+                and node.args
+                and isinstance(node.args[0], ast.Constant)
+                and isinstance(node.args[0].value, str)
+                and _is_redos_prone(node.args[0].value, _call_flags(node, _REGEX_FUNCTIONS[func.attr]))):
+            self.regex_patterns.append({
+                "type": "Catastrophic Backtracking Regex",
+                "severity": "MEDIUM",
+                "description": "Nested quantifiers can cause exponential regex backtracking (ReDoS)",
+                "pattern": node.args[0].value
+            })
+
+
+_BugVisitor._handlers = {
+    ast.Import: _BugVisitor.visit_Import,
+    ast.ImportFrom: _BugVisitor.visit_Import,
+    ast.ExceptHandler: _BugVisitor.visit_ExceptHandler,
+    ast.FunctionDef: _BugVisitor.visit_FunctionDef,
+    ast.Call: _BugVisitor.visit_Call,
+}
+
 
 class BugPatternDetector:
     """Detects common bug patterns and code smells."""
@@ -20,39 +317,20 @@ class BugPatternDetector:
             
         return self.patterns
     
+    def detect_tree(self, tree: ast.AST) -> List[Dict[str, Any]]:
+        """Detect bug patterns in an already parsed Python AST."""
+        self.patterns = []
+        _BugVisitor(self.patterns).visit(tree)
+        self._check_unused_variables(tree)
+        return self.patterns
+    
     def _detect_python_patterns(self, code: str):
         """Detect Python-specific bug patterns."""
         try:
             tree = ast.parse(code)
-            self._check_bare_except(tree)
-            self._check_mutable_defaults(tree)
-            self._check_unused_variables(tree)
         except SyntaxError:
-            pass
-    
-    def _check_bare_except(self, tree: ast.AST):
-        """Detect bare except clauses."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ExceptHandler):
-                if node.type is None:
-                    self.patterns.append({
-                        "type": "Bare Except Clause",
-                        "severity": "MEDIUM",
-                        "description": "Bare except catches all exceptions, including system exits"
-                    })
-    
-    def _check_mutable_defaults(self, tree: ast.AST):
-        """Detect mutable default arguments."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                for arg in node.args.defaults:
-                    if isinstance(arg, (ast.List, ast.Dict, ast.Set)):
-                        self.patterns.append({
-                            "type": "Mutable Default Argument",
-                            "severity": "HIGH",
-                            "description": "Mutable default arguments can cause unexpected behavior",
-                            "function": node.name
-                        })
+            return
+        self.detect_tree(tree)
     
     def _check_unused_variables(self, tree: ast.AST):
         """Detect potentially unused variables."""
@@ -2,46 +2,82 @@
 
 import numpy as np
 from typing import Dict, List, Any
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.pipeline import make_pipeline
+
+# Rows densified at a time; each dense row is 1024 float64 features (8 KB)
+_CHUNK_SIZE = 2048
 
 
 class MLCodeReviewer:
     """ML-based code reviewer for intelligent suggestions."""
     
     def __init__(self):
-        self.model = RandomForestClassifier(n_estimators=100, random_state=42)
-        self.vectorizer = TfidfVectorizer(max_features=1000)
+        self.model = HistGradientBoostingClassifier(random_state=42)
+        # Feature hashing needs no vocabulary; only the IDF weights are fitted
+        self.vectorizer = make_pipeline(
+            HashingVectorizer(n_features=1024, alternate_sign=False, norm=None),
+            TfidfTransformer(),
+        )
         self.trained = False
         
     def train(self, code_samples: List[str], labels: List[int]):
         """Train the model on code samples."""
-        X = self.vectorizer.fit_transform(code_samples)
+        # HistGradientBoostingClassifier requires dense float64 input and fits
+        # on every row at once, so rows are densified straight into one array
+        features = self.vectorizer.fit_transform(code_samples)
+        X = np.empty(features.shape)
+        for start in range(0, features.shape[0], _CHUNK_SIZE):
+            X[start:start + _CHUNK_SIZE] = features[start:start + _CHUNK_SIZE].toarray()
+        # The default leaf size of 20 cannot split fewer than 40 samples, which
+        # would leave the model predicting the class prior for every input
+        self.model.set_params(min_samples_leaf=max(1, min(20, len(code_samples) // 10)))
         self.model.fit(X, labels)
         self.trained = True
         
     def predict_quality(self, code: str) -> Dict[str, Any]:
         """Predict code quality."""
+        return self.predict_quality_batch([code])[0]
+    
+    def predict_quality_batch(self, codes: List[str]) -> List[Dict[str, Any]]:
+        """Predict code quality for many code samples with one model call."""
+        if not codes:
+            return []
         if not self.trained:
-            return {"score": 0.5, "confidence": 0.0, "trained": False}
+            return [{"score": 0.5, "confidence": 0.0, "trained": False} for _ in codes]
             
-        X = self.vectorizer.transform([code])
-        probability = self.model.predict_proba(X)[0]
+        # Vectorize and predict in chunks so the dense matrix stays small
+        probabilities = np.concatenate([
+            self.model.predict_proba(self.vectorizer.transform(codes[start:start + _CHUNK_SIZE]).toarray())
+            for start in range(0, len(codes), _CHUNK_SIZE)
+        ])
+        scores = probabilities[:, 1]
+        confidences = probabilities.max(axis=1)
         
-        return {
-            "score": probability[1],
-            "confidence": max(probability),
-            "trained": True,
-            "recommendation": "Good" if probability[1] > 0.5 else "Needs Improvement"
-        }
+        return [
+            {
+                "score": score,
+                "confidence": confidence,
+                "trained": True,
+                "recommendation": "Good" if score > 0.5 else "Needs Improvement"
+            }
+            for score, confidence in zip(scores, confidences)
+        ]
         
     def suggest_improvements(self, code: str) -> List[str]:
         """Suggest code improvements based on ML analysis."""
-        suggestions = []
+        return self.suggest_improvements_batch([code])[0]
+    
+    def suggest_improvements_batch(self, codes: List[str]) -> List[List[str]]:
+        """Suggest code improvements for many code samples at once."""
+        all_suggestions = []
         
-        quality = self.predict_quality(code)
-        if quality["score"] < 0.5:
-            suggestions.append("Consider refactoring for better readability")
-            suggestions.append("Add more comments and documentation")
+        for quality in self.predict_quality_batch(codes):
+            suggestions = []
+            if quality["score"] < 0.5:
+                suggestions.append("Consider refactoring for better readability")
+                suggestions.append("Add more comments and documentation")
+            all_suggestions.append(suggestions)
             
-        return suggestions
+        return all_suggestions
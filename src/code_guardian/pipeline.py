@@ -0,0 +1,80 @@
+"""Combined analysis pipeline that parses each file only once."""
+
+import ast
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .analyzer import CodeAnalyzer, _MetricsVisitor
+from .ast_utils import CompositeVisitor
+from .bug_pattern_detector import _BugVisitor
+from .vulnerability_detector import VulnerabilityDetector
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ParsedFile:
+    """Source of a code file together with its parsed AST.
+    
+    ``tree`` is None for non-Python files and for Python files that fail to parse.
+    """
+    source: str
+    tree: Optional[ast.AST]
+    ext: str
+
+
+class Pipeline:
+    """Runs the analyzer and both detectors over a file using a shared parse."""
+    
+    def __init__(self):
+        self.analyzer = CodeAnalyzer()
+        self.vulnerability_detector = VulnerabilityDetector()
+        
+    def parse(self, file_path: str) -> ParsedFile:
+        """Read a code file and parse it if it is Python source."""
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+            
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+            
+        tree = None
+        if path.suffix == '.py':
+            try:
+                tree = ast.parse(source)
+            except SyntaxError:
+                pass
+                
+        return ParsedFile(source=source, tree=tree, ext=path.suffix)
+    
+    def run(self, file_path: str) -> Dict[str, Any]:
+        """Analyze a single code file with every component.
+        
+        Args:
+            file_path: Path to the code file
+            
+        Returns:
+            Analyzer results extended with ``bug_patterns`` and ``vulnerabilities``
+        """
+        try:
+            parsed = self.parse(file_path)
+        except Exception as e:
+            logger.error(f"Error analyzing file {file_path}: {e}")
+            return {"error": str(e), "file_path": file_path}
+            
+        bug_patterns = []
+        if parsed.tree is not None:
+            # One traversal feeds both the metric handlers and the bug rules
+            metrics = _MetricsVisitor()
+            CompositeVisitor(metrics, _BugVisitor(bug_patterns)).visit(parsed.tree)
+            results = self.analyzer._analyze_code(parsed.source, parsed.ext, metrics.results())
+        else:
+            results = self.analyzer._analyze_code(parsed.source, parsed.ext)
+            
+        results["bug_patterns"] = bug_patterns
+        results["vulnerabilities"] = self.vulnerability_detector.detect(parsed.source, parsed.ext)
+        results["file_path"] = file_path
+        return results
@@ -1,18 +1,29 @@
 """Vulnerability detection module for security analysis."""
 
-import re
 from typing import List, Dict, Any
 
+try:
+    import re2 as _re
+except ImportError:
+    import re as _re
+
 
 class VulnerabilityDetector:
     """Detects security vulnerabilities in code."""
     
+    # Patterns avoid \s, \w and \b, which are ASCII-only under RE2 but
+    # Unicode-aware under the stdlib re module
     SQL_INJECTION_PATTERNS = [
         r"execute\([^)]*%s",
         r"execute\([^)]*\+",
         r"cursor\.execute\([^)]*format",
     ]
     
+    SECRET_PATTERNS = [
+        r"(?i)password[ \t\n\r\f\v]*=[ \t\n\r\f\v]*['\"][^'\"]+['\"]",
+        r"(?i)api[_-]?key[ \t\n\r\f\v]*=[ \t\n\r\f\v]*['\"][^'\"]+['\"]",
+    ]
+    
     def __init__(self):
         self.vulnerabilities = []
         
@@ -29,14 +40,14 @@ class VulnerabilityDetector:
     def _detect_python_vulnerabilities(self, code: str):
         """Detect Python-specific vulnerabilities."""
         for pattern in self.SQL_INJECTION_PATTERNS:
-            if re.search(pattern, code):
+            if _re.search(pattern, code):
                 self.vulnerabilities.append({
                     "type": "SQL Injection Risk",
                     "severity": "HIGH",
                     "description": "Possible SQL injection vulnerability"
                 })
         
-        if re.search(r"\beval\(|\bexec\(", code):
+        if _re.search(r"(?:^|[^A-Za-z0-9_])(?:eval|exec)\(", code):
             self.vulnerabilities.append({
                 "type": "Code Injection",
                 "severity": "CRITICAL",
@@ -45,13 +56,8 @@ class VulnerabilityDetector:
     
     def _detect_common_vulnerabilities(self, code: str):
         """Detect common vulnerabilities."""
-        secret_patterns = [
-            r"password\s*=\s*['\"][^'\"]+['\"]",
-            r"api[_-]?key\s*=\s*['\"][^'\"]+['\"]",
-        ]
-        
-        for pattern in secret_patterns:
-            if re.search(pattern, code, re.IGNORECASE):
+        for pattern in self.SECRET_PATTERNS:
+            if _re.search(pattern, code):
                 self.vulnerabilities.append({
                     "type": "Hardcoded Secret",
                     "severity": "CRITICAL",
@@ -0,0 +1,52 @@
+"""Tests for the code analyzer."""
+
+import logging
+
+from code_guardian import CodeAnalyzer, analyzer as analyzer_module
+
+
+def test_analyze_directory_in_process(tmp_path):
+    (tmp_path / "a.py").write_text("import os\nif x:\n    pass\n")
+    (tmp_path / "b.py").write_text("import os\nif x:\n    pass\n")
+    (tmp_path / "c.js").write_text("function f() {}\n")
+    
+    results = list(CodeAnalyzer().analyze_directory(str(tmp_path), max_workers=1))
+    
+    by_name = {r["file_path"].rsplit("/", 1)[-1]: r for r in results}
+    assert set(by_name) == {"a.py", "b.py", "c.js"}
+    assert by_name["a.py"]["complexity"] == by_name["b.py"]["complexity"] == 2
+    assert by_name["b.py"]["imports"] == ["os"]
+    assert by_name["c.js"]["functions"] == 1
+
+
+def test_analyze_directory_pool_matches_in_process(tmp_path, caplog):
+    for i in range(20):
+        sub = tmp_path / f"pkg{i % 3}"
+        sub.mkdir(exist_ok=True)
+        # Files 0-13 are unique; 14-19 duplicate files 0-5 byte for byte
+        n = i % 14
+        (sub / f"m{i}.py").write_text("if a or b:\n    pass\n" * (n % 4) + f"import mod{n}\n")
+    (tmp_path / "app.js").write_text("const f = () => 1;\nfunction g() {}\n")
+    
+    analyzer = CodeAnalyzer()
+    with caplog.at_level(logging.INFO, logger="code_guardian.analyzer"):
+        in_process = list(analyzer.analyze_directory(str(tmp_path), max_workers=1))
+        pooled = list(analyzer.analyze_directory(str(tmp_path), max_workers=2))
+        
+    assert len(in_process) == 21
+    assert pooled == in_process
+    assert sum("Reusing analysis" in m for m in caplog.messages) == 2 * 6
+
+
+def test_python_analysis_is_cached_and_isolated():
+    source = "import os\nimport sys\n\ndef f():\n    return 1\n"
+    analyzer = CodeAnalyzer()
+    
+    first = analyzer._analyze_python(source)
+    assert analyzer_module._source_key(source) in analyzer_module._python_cache
+    first["imports"].append("mutated")
+    
+    second = analyzer._analyze_python(source)
+    assert second == {"complexity": 1, "functions": 1, "classes": 0, "imports": ["os", "sys"]}
+    second["imports"].clear()
+    assert analyzer._analyze_python(source)["imports"] == ["os", "sys"]
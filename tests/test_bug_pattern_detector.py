@@ -0,0 +1,47 @@
+"""Tests for the bug pattern detector."""
+
+import warnings
+
+from code_guardian import BugPatternDetector
+
+
+def _types(patterns):
+    return [p["type"] for p in patterns]
+
+
+def test_nested_quantifier_is_flagged():
+    patterns = BugPatternDetector().detect('import re\nP = re.compile(r"(a+)+$")\n')
+    assert _types(patterns) == ["Catastrophic Backtracking Regex"]
+
+
+def test_separator_delimited_repeat_is_not_flagged():
+    for pattern in [r"^\d+(\.\d+)*$", r"[a-z0-9]+(?:-[a-z0-9]+)*", r"(\d+,)+"]:
+        source = f'import re\nP = re.compile(r"{pattern}")\n'
+        assert BugPatternDetector().detect(source) == [], pattern
+        
+        
+def test_verbose_flag_is_honoured():
+    # Only in verbose mode is the trailing space dropped, leaving "-" as a separator
+    pattern = 'r"(\\s+- )+"'
+    assert BugPatternDetector().detect(f"import re\nP = re.compile({pattern}, re.X)\n") == []
+    assert BugPatternDetector().detect(f"import re\nre.sub({pattern}, '', s, flags=re.I | re.X)\n") == []
+    assert _types(BugPatternDetector().detect(f"import re\nP = re.compile({pattern})\n")) == [
+        "Catastrophic Backtracking Regex"
+    ]
+    
+    
+def test_parser_warnings_are_suppressed():
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        BugPatternDetector().detect('import re\nP = re.compile(r"[[a]")\n')
+    assert caught == []
+        
+        
+def test_nested_quantifier_inside_lookaround_is_flagged():
+    patterns = BugPatternDetector().detect('import re\nP = re.compile(r"(?=(a+)+)b")\n')
+    assert _types(patterns) == ["Catastrophic Backtracking Regex"]
+
+
+def test_oversized_repeat_count_does_not_raise():
+    patterns = BugPatternDetector().detect('import re\nP = re.compile(r"a{99999999999}")\n')
+    assert patterns == []
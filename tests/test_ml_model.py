@@ -0,0 +1,30 @@
+"""Tests for the ML code reviewer."""
+
+from code_guardian import MLCodeReviewer, ml_model
+
+
+def test_small_training_set_separates_classes():
+    reviewer = MLCodeReviewer()
+    reviewer.train(["def f(): pass"] * 10 + ["x=1"] * 10, [1] * 10 + [0] * 10)
+    
+    good, bad = reviewer.predict_quality_batch(["def g(): pass", "x=1"])
+    assert good["recommendation"] == "Good"
+    assert bad["recommendation"] == "Needs Improvement"
+
+
+def test_empty_batch_returns_empty_list():
+    reviewer = MLCodeReviewer()
+    assert reviewer.predict_quality_batch([]) == []
+    
+    reviewer.train(["def f(): pass", "x=1"] * 5, [1, 0] * 5)
+    assert reviewer.predict_quality_batch([]) == []
+    assert reviewer.suggest_improvements_batch([]) == []
+
+
+def test_chunked_batches_match_single_predictions(monkeypatch):
+    monkeypatch.setattr(ml_model, "_CHUNK_SIZE", 3)
+    reviewer = MLCodeReviewer()
+    reviewer.train(["def f(): pass"] * 10 + ["x=1"] * 10, [1] * 10 + [0] * 10)
+    
+    codes = ["def g(): pass", "x=1", "y=2", "def h(a): return a", "z=3", "def k(): pass", "w=4"]
+    assert reviewer.predict_quality_batch(codes) == [reviewer.predict_quality(code) for code in codes]
@@ -0,0 +1,15 @@
+"""Tests for the single-parse pipeline."""
+
+from code_guardian import BugPatternDetector, Pipeline
+
+
+def test_pipeline_and_detector_agree(tmp_path):
+    sources = [
+        'P = re.compile(r"(a+)+")\n',
+        'def f(a=[]):\n    return re.compile(r"(a+)+")\n'
+        'try:\n    pass\nexcept:\n    pass\nimport re\n',
+    ]
+    for source in sources:
+        path = tmp_path / "mod.py"
+        path.write_text(source)
+        assert Pipeline().run(str(path))["bug_patterns"] == BugPatternDetector().detect(source)